@@ -34,6 +34,8 @@ NONCE_PARAMETER = OpenApiParameter(
     required=False,
 )
 
+add_nonce_parameter = extend_schema(parameters=[NONCE_PARAMETER])
+
 
 # Can't use the auto_schema as it's not passed to view inspectors. Code inspired on
 # drf_spectacular.openapi.AutoSchema._get_serializer
@@ -97,26 +99,51 @@ class CSPPostProcessedHTMLFieldExtension(OpenApiViewExtension):
     target_class = APIView
     match_subclasses = True
 
-    def view_replacement(self):
+    # drf-spectacular may run the view extensions multiple times for the same view
+    # during schema generation, while the outcome only depends on the view class
+    _is_post_processable: dict[type[APIView], bool] = {}
+    _fixed_views: dict[type[APIView], type[APIView]] = {}
+
+    def _check_post_processable(self) -> bool:
         serializer = _get_serializer_class(self.target)
         # definitely not post-processable, as there is no (output) serializer
         if serializer is None:
-            return self.target
-
-        # now check if the serializer has a CSPPostProcessedHTMLField
+            return False
+
+        # now check if the serializer has a CSPPostProcessedHTMLField - explicitly
+        # declared fields are known on the class, which avoids building all the
+        # (model) fields through ``get_fields``
+        declared_fields = getattr(serializer, "_declared_fields", {})
+        if any(
+            isinstance(field, CSPPostProcessedHTMLField)
+            for field in declared_fields.values()
+        ):
+            return True
+
+        # model serializer fields may be mapped to CSPPostProcessedHTMLField too
         serializer = force_instance(serializer)
-        is_post_processable = any(
+        return any(
             (
                 isinstance(field, CSPPostProcessedHTMLField)
                 for field in serializer.get_fields().values()
             )
         )
+
+    def view_replacement(self):
+        cache = self._is_post_processable
+        if (is_post_processable := cache.get(self.target)) is None:
+            is_post_processable = cache[self.target] = self._check_post_processable()
+
         if not is_post_processable:
             return self.target
 
-        # ok, it's post proccessable -> add the header parameter
-        @extend_schema(parameters=[NONCE_PARAMETER])
-        class FixedView(self.target):
-            pass
+        # ok, it's post proccessable -> add the header parameter, once per view class
+        if (fixed_view := self._fixed_views.get(self.target)) is None:
+
+            @add_nonce_parameter
+            class FixedView(self.target):
+                pass
+
+            fixed_view = self._fixed_views[self.target] = FixedView
 
-        return FixedView
+        return fixed_view
@@ -69,10 +69,13 @@ class ValidationErrorSerializer(ExceptionSerializer):
 
 class ListWithChildSerializer(serializers.ListSerializer):
     child_serializer_class = None  # class or dotted import path
+    batch_size: int | None = 1000  # passed to bulk_create, ``None`` for a single query
 
     def __init__(self, *args, **kwargs):
-        child_serializer_class = self.get_child_serializer_class()
-        kwargs.setdefault("child", child_serializer_class())
+        # ``many=True`` on the child serializer already provides the child instance
+        if "child" not in kwargs:
+            child_serializer_class = self.get_child_serializer_class()
+            kwargs["child"] = child_serializer_class()
         super().__init__(*args, **kwargs)
 
     def get_child_serializer_class(self):
@@ -88,13 +91,16 @@ class ListWithChildSerializer(serializers.ListSerializer):
 
     def create(self, validated_data):
         validated_data = self.preprocess_validated_data(validated_data)
-        model = self.get_child_serializer_class().Meta.model
+        # the child serializer is bound in __init__, no need to resolve the class again
+        model = self.child.Meta.model
         objects_to_create = []
         for data_dict in validated_data:
             obj = model(**data_dict)
             objects_to_create.append(self.process_object(obj))
 
-        return model._default_manager.bulk_create(objects_to_create)
+        return model._default_manager.bulk_create(
+            objects_to_create, batch_size=self.batch_size
+        )
 
 
 class PublicFieldsSerializerMixin:
@@ -116,17 +122,39 @@ class PublicFieldsSerializerMixin:
     #                 "family_name",
     #             )
 
+    # The admin-only field names are derived from the (static) ``Meta`` options, so they
+    # are computed once when the serializer class is created rather than on every
+    # ``get_fields`` call.
+    _admin_field_names: tuple[str, ...] = ()
+    _admin_field_names_camelized: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, "Meta", None)
+        if meta is None or not hasattr(meta, "public_fields"):
+            # don't inherit admin field names computed against a parent's field set
+            cls._admin_field_names = ()
+            cls._admin_field_names_camelized = ()
+            return
+        public_fields = set(meta.public_fields)
+        cls._admin_field_names = tuple(
+            name for name in meta.fields if name not in public_fields
+        )
+        cls._admin_field_names_camelized = tuple(
+            underscore_to_camel(name) for name in cls._admin_field_names
+        )
+
     @classmethod
     def _get_admin_field_names(cls, camelize=True) -> list[str]:
-        formatter = underscore_to_camel if camelize else lambda x: x
-        return [
-            formatter(name)
-            for name in cls.Meta.fields
-            if name not in cls.Meta.public_fields
-        ]
+        if camelize:
+            return list(cls._admin_field_names_camelized)
+        return list(cls._admin_field_names)
 
     def get_fields(self):
         fields = super().get_fields()
+        # nothing to filter, so there's no need to inspect the context
+        if not self._admin_field_names:
+            return fields
 
         request = self.context.get("request")
         view = self.context.get("view")
@@ -137,14 +165,12 @@ class PublicFieldsSerializerMixin:
             request, "is_mock_request", is_api_schema_generation
         )
 
-        admin_only_fields = self._get_admin_field_names(camelize=False)
-
         # filter public fields if not staff and not exporting or schema generating
         # request.is_mock_request is set by the export serializers (possibly from management command etc)
         # also this can be called from schema generator without request
         if request and not is_mock_request:
             if not request.user.is_staff:
-                for admin_field in admin_only_fields:
+                for admin_field in self._admin_field_names:
                     del fields[admin_field]
 
         return fields
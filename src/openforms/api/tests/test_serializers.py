@@ -0,0 +1,71 @@
+from django.contrib.auth.models import AnonymousUser
+from django.test import SimpleTestCase
+
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory
+
+from ..serializers import PublicFieldsSerializerMixin
+
+
+class PersonSerializer(PublicFieldsSerializerMixin, serializers.Serializer):
+    first_name = serializers.CharField()
+    family_name = serializers.CharField()
+    phone_number = serializers.CharField()
+
+    class Meta:
+        fields = (
+            "first_name",
+            "family_name",
+            "phone_number",
+        )
+        public_fields = (
+            "first_name",
+            "family_name",
+        )
+
+
+class PublicFieldsSerializerMixinTests(SimpleTestCase):
+    def test_admin_field_names(self):
+        self.assertEqual(PersonSerializer._get_admin_field_names(), ["phoneNumber"])
+        self.assertEqual(
+            PersonSerializer._get_admin_field_names(camelize=False), ["phone_number"]
+        )
+
+    def test_admin_field_names_inherited_meta(self):
+        class ExtendedPersonSerializer(PersonSerializer):
+            email_address = serializers.CharField()
+
+            class Meta(PersonSerializer.Meta):
+                fields = PersonSerializer.Meta.fields + ("email_address",)
+
+        self.assertEqual(
+            ExtendedPersonSerializer._get_admin_field_names(),
+            ["phoneNumber", "emailAddress"],
+        )
+
+    def test_admin_field_names_meta_without_public_fields(self):
+        class PhoneNumberSerializer(PersonSerializer):
+            class Meta:
+                fields = ("phone_number",)
+
+        self.assertEqual(PhoneNumberSerializer._get_admin_field_names(), [])
+        self.assertEqual(
+            PhoneNumberSerializer._get_admin_field_names(camelize=False), []
+        )
+
+    def test_no_admin_fields(self):
+        class PublicPersonSerializer(
+            PublicFieldsSerializerMixin, serializers.Serializer
+        ):
+            first_name = serializers.CharField()
+
+            class Meta:
+                fields = ("first_name",)
+                public_fields = ("first_name",)
+
+        request = APIRequestFactory().get("/")
+        request.user = AnonymousUser()
+        serializer = PublicPersonSerializer(context={"request": request})
+
+        self.assertEqual(PublicPersonSerializer._get_admin_field_names(), [])
+        self.assertEqual(list(serializer.fields), ["first_name"])
@@ -1,5 +1,6 @@
 import re
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 from django.db import models
@@ -20,6 +21,12 @@ def underscore_to_camel(input_: str | int) -> str:
     if not isinstance(input_, str):
         return input_
 
+    return _camelize(input_)
+
+
+@lru_cache(maxsize=4096)
+def _camelize(input_: str) -> str:
+    # the same (field) names are converted over and over again
     return re.sub(camelize_re, _underscore_to_camel, input_)
 
 
@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, time
 from unittest.mock import patch
 
@@ -5,18 +6,16 @@ from django.utils import timezone
 from django.utils.translation import gettext as _
 
 from freezegun import freeze_time
-from hypothesis import given
-from hypothesis.extra.django import TestCase as HypothesisTestCase
 from rest_framework import status
 from rest_framework.reverse import reverse, reverse_lazy
 from rest_framework.test import APITestCase
 
 from openforms.config.models import GlobalConfiguration
 from openforms.forms.constants import SubmissionAllowedChoices
+from openforms.forms.tests.factories import FormFactory
 from openforms.submissions.constants import PostSubmissionEvents
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.submissions.tests.mixins import SubmissionsMixin
-from openforms.tests.search_strategies import json_values
 
 from ..models import Appointment, AppointmentsConfig
 
@@ -28,23 +27,22 @@ class ConfigPatchMixin:
     def setUp(self):
         super().setUp()  # type: ignore
         self.config = AppointmentsConfig(plugin="demo", limit_to_location="1")
-        paths = [
-            "openforms.appointments.utils.AppointmentsConfig.get_solo",
-            "openforms.appointments.api.serializers.AppointmentsConfig.get_solo",
+        self.global_configuration = GlobalConfiguration(ask_privacy_consent=True)
+
+        # patching the classmethods on the model classes applies to every module
+        # importing them
+        patchers = [
+            patch.object(AppointmentsConfig, "get_solo", return_value=self.config),
+            patch.object(
+                GlobalConfiguration,
+                "get_solo",
+                return_value=self.global_configuration,
+            ),
         ]
-        for path in paths:
-            patcher = patch(path, return_value=self.config)
+        for patcher in patchers:
             patcher.start()
             self.addCleanup(patcher.stop)  # type: ignore
 
-        self.global_configuration = GlobalConfiguration(ask_privacy_consent=True)
-        global_config_patcher = patch(
-            "openforms.forms.models.form.GlobalConfiguration.get_solo",
-            return_value=self.global_configuration,
-        )
-        global_config_patcher.start()
-        self.addCleanup(global_config_patcher.stop)  # type: ignore
-
 
 class AppointmentCreateSuccessTests(ConfigPatchMixin, SubmissionsMixin, APITestCase):
     """
@@ -56,19 +54,20 @@ class AppointmentCreateSuccessTests(ConfigPatchMixin, SubmissionsMixin, APITestC
         super().setUpTestData()
 
         cls.submission = SubmissionFactory.create(form__is_appointment_form=True)
+        cls.submission_url = reverse(
+            "api:submission-detail", kwargs={"uuid": cls.submission.uuid}
+        )
+        cls.appointment_datetime = timezone.make_aware(
+            datetime.combine(TODAY, time(15, 15))
+        )
 
     def setUp(self):
         super().setUp()
         self._add_submission_to_session(self.submission)
 
     def test_appointment_data_is_recorded(self):
-        appointment_datetime = timezone.make_aware(
-            datetime.combine(TODAY, time(15, 15))
-        )
         data = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "products": [
                 {
                     "productId": "2",
@@ -77,7 +76,7 @@ class AppointmentCreateSuccessTests(ConfigPatchMixin, SubmissionsMixin, APITestC
             ],
             "location": "1",
             "date": TODAY.isoformat(),
-            "datetime": appointment_datetime.isoformat(),
+            "datetime": self.appointment_datetime.isoformat(),
             "contactDetails": {
                 "lastName": "Periwinkle",
                 "email": "user@example.com",
@@ -92,7 +91,7 @@ class AppointmentCreateSuccessTests(ConfigPatchMixin, SubmissionsMixin, APITestC
         self.assertEqual(appointment.submission, self.submission)
         self.assertEqual(appointment.plugin, "demo")
         self.assertEqual(appointment.location, "1")
-        self.assertEqual(appointment.datetime, appointment_datetime)
+        self.assertEqual(appointment.datetime, self.appointment_datetime)
         self.assertEqual(
             appointment.contact_details_meta,
             [
@@ -124,13 +123,8 @@ class AppointmentCreateSuccessTests(ConfigPatchMixin, SubmissionsMixin, APITestC
 
     @patch("openforms.submissions.api.mixins.on_post_submission_event")
     def test_submission_is_completed(self, mock_on_post_submission_event):
-        appointment_datetime = timezone.make_aware(
-            datetime.combine(TODAY, time(15, 15))
-        )
         data = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "products": [
                 {
                     "productId": "2",
@@ -139,7 +133,7 @@ class AppointmentCreateSuccessTests(ConfigPatchMixin, SubmissionsMixin, APITestC
             ],
             "location": "1",
             "date": TODAY,
-            "datetime": appointment_datetime.isoformat(),
+            "datetime": self.appointment_datetime.isoformat(),
             "contactDetails": {
                 "lastName": "Periwinkle",
                 "email": "user@example.com",
@@ -164,17 +158,12 @@ class AppointmentCreateSuccessTests(ConfigPatchMixin, SubmissionsMixin, APITestC
         # When there are on_completion processing errors, the client will re-post the
         # same state. This must update the existing appointment rather than trying to
         # create a new one.
-        appointment_datetime = timezone.make_aware(
-            datetime.combine(TODAY, time(15, 15))
-        )
         data = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "products": [{"productId": "2", "amount": 1}],
             "location": "1",
             "date": TODAY,
-            "datetime": appointment_datetime.isoformat(),
+            "datetime": self.appointment_datetime.isoformat(),
             "contactDetails": {
                 "lastName": "Periwinkle",
                 "email": "user@example.com",
@@ -213,13 +202,8 @@ class AppointmentCreateSuccessTests(ConfigPatchMixin, SubmissionsMixin, APITestC
 
     def test_privacy_policy_not_required(self):
         self.global_configuration.ask_privacy_consent = False
-        appointment_datetime = timezone.make_aware(
-            datetime.combine(TODAY, time(15, 15))
-        )
         data = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "products": [
                 {
                     "productId": "2",
@@ -228,7 +212,7 @@ class AppointmentCreateSuccessTests(ConfigPatchMixin, SubmissionsMixin, APITestC
             ],
             "location": "1",
             "date": TODAY.isoformat(),
-            "datetime": appointment_datetime.isoformat(),
+            "datetime": self.appointment_datetime.isoformat(),
             "contactDetails": {
                 "lastName": "Periwinkle",
                 "email": "user@example.com",
@@ -241,13 +225,23 @@ class AppointmentCreateSuccessTests(ConfigPatchMixin, SubmissionsMixin, APITestC
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
 
-class AppointmentCreateInvalidPermissionsTests(
-    SubmissionsMixin, APITestCase, HypothesisTestCase
-):
+class AppointmentCreateInvalidPermissionsTests(SubmissionsMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        form = FormFactory.create(is_appointment_form=True)
+        cls.submission, cls.other_submission = SubmissionFactory.create_batch(
+            2, form=form
+        )
+        cls.submission_not_allowed = SubmissionFactory.create(
+            form__is_appointment_form=True,
+            form__submission_allowed=SubmissionAllowedChoices.no_with_overview,
+        )
+
     def test_no_submission_in_session(self):
-        submission = SubmissionFactory.create(form__is_appointment_form=True)
         submission_url = reverse(
-            "api:submission-detail", kwargs={"uuid": submission.uuid}
+            "api:submission-detail", kwargs={"uuid": self.submission.uuid}
         )
 
         response = self.client.post(ENDPOINT, {"submission": submission_url})
@@ -255,8 +249,7 @@ class AppointmentCreateInvalidPermissionsTests(
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_no_submission_in_request_body(self):
-        submission = SubmissionFactory.create(form__is_appointment_form=True)
-        self._add_submission_to_session(submission)
+        self._add_submission_to_session(self.submission)
 
         empty_ish_bodies = [
             {},
@@ -270,32 +263,47 @@ class AppointmentCreateInvalidPermissionsTests(
                 self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_different_submission_url_in_request_body(self):
-        submission1, submission2 = SubmissionFactory.create_batch(
-            2, form__is_appointment_form=True
-        )
-        self._add_submission_to_session(submission1)
-        submission2_url = reverse(
-            "api:submission-detail", kwargs={"uuid": submission2.uuid}
+        self._add_submission_to_session(self.submission)
+        other_submission_url = reverse(
+            "api:submission-detail", kwargs={"uuid": self.other_submission.uuid}
         )
 
-        response = self.client.post(ENDPOINT, {"submission": submission2_url})
+        response = self.client.post(ENDPOINT, {"submission": other_submission_url})
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-    @given(json_values())
-    def test_invalid_submission_url_in_request_body(self, submission_url):
-        response = self.client.post(ENDPOINT, {"submission": submission_url})
+    def test_invalid_submission_url_in_request_body(self):
+        self._add_submission_to_session(self.submission)
+        valid_url = reverse(
+            "api:submission-detail", kwargs={"uuid": self.submission.uuid}
+        )
+        invalid_values = [
+            "",
+            "not-a-url",
+            # date/time values sent in the wrong field
+            "2023-13-01T10:00:00Z",
+            "+02:00",
+            # URLs that don't point to the submission in the session
+            valid_url.replace(str(self.submission.uuid), "not-a-uuid"),
+            reverse("api:submission-detail", kwargs={"uuid": uuid.uuid4()}),
+            reverse(
+                "api:form-detail", kwargs={"uuid_or_slug": self.submission.form.uuid}
+            ),
+            # not a string at all
+            123,
+            {"url": valid_url},
+        ]
 
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        for submission_url in invalid_values:
+            with self.subTest(submission_url=submission_url):
+                response = self.client.post(ENDPOINT, {"submission": submission_url})
+
+                self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_no_submission_allowed_on_form(self):
-        submission = SubmissionFactory.create(
-            form__is_appointment_form=True,
-            form__submission_allowed=SubmissionAllowedChoices.no_with_overview,
-        )
-        self._add_submission_to_session(submission)
+        self._add_submission_to_session(self.submission_not_allowed)
         submission_url = reverse(
-            "api:submission-detail", kwargs={"uuid": submission.uuid}
+            "api:submission-detail", kwargs={"uuid": self.submission_not_allowed.uuid}
         )
 
         response = self.client.post(ENDPOINT, {"submission": submission_url})
@@ -311,6 +319,12 @@ class AppointmentCreateValidationErrorTests(
         super().setUpTestData()
 
         cls.submission = SubmissionFactory.create(form__is_appointment_form=True)
+        cls.submission_url = reverse(
+            "api:submission-detail", kwargs={"uuid": cls.submission.uuid}
+        )
+        cls.appointment_datetime = timezone.make_aware(
+            datetime.combine(TODAY, time(15, 15))
+        )
 
     def setUp(self):
         super().setUp()
@@ -318,9 +332,7 @@ class AppointmentCreateValidationErrorTests(
 
     def test_required_privacy_policy_accept_missing(self):
         valid_data = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "products": [
                 {
                     "productId": "2",
@@ -356,16 +368,11 @@ class AppointmentCreateValidationErrorTests(
                 self.assertEqual(invalid_params[0]["name"], "privacyPolicyAccepted")
 
     def test_invalid_products(self):
-        appointment_datetime = timezone.make_aware(
-            datetime.combine(TODAY, time(15, 15))
-        )
         base = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "location": "1",
             "date": TODAY.isoformat(),
-            "datetime": appointment_datetime.isoformat(),
+            "datetime": self.appointment_datetime.isoformat(),
             "contactDetails": {
                 "lastName": "Periwinkle",
                 "email": "user@example.com",
@@ -436,17 +443,12 @@ class AppointmentCreateValidationErrorTests(
     def test_invalid_location_with_fixed_location_in_config(self):
         # made up, but you can assume this is valid via the admin validation
         self.config.limit_to_location = "2"
-        appointment_datetime = timezone.make_aware(
-            datetime.combine(TODAY, time(15, 15))
-        )
         data = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "products": [{"productId": "1", "amount": 1}],
             "location": "1",
             "date": TODAY.isoformat(),
-            "datetime": appointment_datetime.isoformat(),
+            "datetime": self.appointment_datetime.isoformat(),
             "contactDetails": {
                 "lastName": "Periwinkle",
                 "email": "user@example.com",
@@ -464,17 +466,12 @@ class AppointmentCreateValidationErrorTests(
     def test_invalid_location_from_plugins_available_locations(self):
         # made up, but you can assume this is valid via the admin validation
         self.config.limit_to_location = ""
-        appointment_datetime = timezone.make_aware(
-            datetime.combine(TODAY, time(15, 15))
-        )
         data = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "products": [{"productId": "1", "amount": 1}],
             "location": "123",
             "date": TODAY.isoformat(),
-            "datetime": appointment_datetime.isoformat(),
+            "datetime": self.appointment_datetime.isoformat(),
             "contactDetails": {
                 "lastName": "Periwinkle",
                 "email": "user@example.com",
@@ -490,16 +487,11 @@ class AppointmentCreateValidationErrorTests(
         self.assertEqual(invalid_params[0]["name"], "location")
 
     def test_invalid_date(self):
-        appointment_datetime = timezone.make_aware(
-            datetime.combine(TODAY, time(15, 15))
-        )
         base = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "products": [{"productId": "1", "amount": 1}],
             "location": "1",
-            "datetime": appointment_datetime.isoformat(),
+            "datetime": self.appointment_datetime.isoformat(),
             "contactDetails": {
                 "lastName": "Periwinkle",
                 "email": "user@example.com",
@@ -532,9 +524,7 @@ class AppointmentCreateValidationErrorTests(
     def test_invalid_datetime(self):
         today = timezone.localdate()
         base = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "products": [{"productId": "1", "amount": 1}],
             "location": "1",
             "date": today.isoformat(),
@@ -586,17 +576,12 @@ class AppointmentCreateValidationErrorTests(
             self.assertEqual(invalid_params[0]["name"], "datetime")
 
     def test_invalid_contact_details(self):
-        appointment_datetime = timezone.make_aware(
-            datetime.combine(TODAY, time(15, 15))
-        )
         base = {
-            "submission": reverse(
-                "api:submission-detail", kwargs={"uuid": self.submission.uuid}
-            ),
+            "submission": self.submission_url,
             "products": [{"productId": "1", "amount": 1}],
             "location": "1",
             "date": TODAY.isoformat(),
-            "datetime": appointment_datetime.isoformat(),
+            "datetime": self.appointment_datetime.isoformat(),
             "privacyPolicyAccepted": True,
         }
 
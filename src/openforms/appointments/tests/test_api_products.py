@@ -18,18 +18,18 @@ class ProductListTests(SubmissionsMixin, APITestCase):
         cls.submission = SubmissionFactory.create()
         cls.endpoint = reverse("api:appointments-products-list")
 
+    @patch(
+        "openforms.appointments.utils.AppointmentsConfig.get_solo",
+        return_value=AppointmentsConfig(
+            plugin="demo",
+            limit_to_location="some-location-id",
+        ),
+    )
     @patch("openforms.appointments.api.views.get_plugin")
-    def test_list_products_with_fixed_location_in_config(self, mock_get_plugin):
+    def test_list_products_with_fixed_location_in_config(
+        self, mock_get_plugin, mock_get_solo
+    ):
         mock_plugin = mock_get_plugin.return_value
-        config_patcher = patch(
-            "openforms.appointments.utils.AppointmentsConfig.get_solo",
-            return_value=AppointmentsConfig(
-                plugin="demo",
-                limit_to_location="some-location-id",
-            ),
-        )
-        config_patcher.start()
-        self.addCleanup(config_patcher.stop)
         self._add_submission_to_session(self.submission)
 
         response = self.client.get(self.endpoint)
@@ -39,15 +39,13 @@ class ProductListTests(SubmissionsMixin, APITestCase):
             location_id="some-location-id"
         )
 
+    @patch(
+        "openforms.appointments.utils.AppointmentsConfig.get_solo",
+        return_value=AppointmentsConfig(plugin="demo"),
+    )
     @patch("openforms.appointments.api.views.get_plugin")
-    def test_list_products_with_existing_product(self, mock_get_plugin):
+    def test_list_products_with_existing_product(self, mock_get_plugin, mock_get_solo):
         mock_plugin = mock_get_plugin.return_value
-        config_patcher = patch(
-            "openforms.appointments.utils.AppointmentsConfig.get_solo",
-            return_value=AppointmentsConfig(plugin="demo"),
-        )
-        config_patcher.start()
-        self.addCleanup(config_patcher.stop)
         self._add_submission_to_session(self.submission)
 
         response = self.client.get(self.endpoint, {"product_id": ["123", "456"]})
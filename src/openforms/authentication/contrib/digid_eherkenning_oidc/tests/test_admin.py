@@ -24,31 +24,49 @@ from ..models import (
 @override_settings(SOLO_CACHE=None)
 @disable_admin_mfa()
 class AdminTestsBase(WebTest):
-    pass
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user = SuperUserFactory.create()
+        # a form using an unrelated authentication backend must not block disabling
+        FormFactory.create(authentication_backends=["other-backend"])
 
 
-def _set_arrayfields(form, config: BaseConfig) -> None:
+def _serialize_json_widget_fields(config: BaseConfig) -> dict[str, str]:
     """
-    Set the field values manually, normally this is done through JS in the admin.
+    Serialize the values of the fields edited through a JSON widget in the admin.
     """
-    fields = [
-        f.name
+    return {
+        f.name: json.dumps(getattr(config, f.name))
         for f in config._meta.get_fields()
         if isinstance(f, (ArrayField, JSONField))
-    ]
-    for field in fields:
-        form[field] = json.dumps(getattr(config, field))
+    }
 
 
-class DigiDConfigAdminTests(AdminTestsBase):
-    CHANGE_PAGE_URL = reverse_lazy("admin:digid_eherkenning_oidc_ofdigidconfig_change")
+def _set_json_widget_fields(form, values: dict[str, str]) -> None:
+    """
+    Set the field values manually, normally this is done through JS in the admin.
+    """
+    for field, value in values.items():
+        form[field] = value
+
+
+class ConfigAdminTestsMixin:
+    """
+    Tests shared by the admin of all the OIDC config models.
+    """
+
+    config_model: type[BaseConfig]
+    form_id: str
+    authentication_backend: str
 
     @classmethod
     def setUpTestData(cls):
-        super().setUpTestData()
+        super().setUpTestData()  # type: ignore
 
         # minimal configuration to pass form validation & not do network IO
-        cls.config = config = OFDigiDConfig(
+        cls.config = config = cls.config_model(
             enabled=True,
             oidc_rp_client_id="testclient",
             oidc_rp_client_secret="secret",
@@ -58,14 +76,13 @@ class DigiDConfigAdminTests(AdminTestsBase):
             oidc_op_logout_endpoint="http://localhost/oidc/logout",
         )
         config.save()
-        cls.user = SuperUserFactory.create()
+        cls.json_widget_values = _serialize_json_widget_fields(config)
 
     def test_can_disable_backend_iff_unused_in_forms(self):
-        FormFactory.create(authentication_backends=["other-backend"])
         change_page = self.app.get(self.CHANGE_PAGE_URL, user=self.user)
 
-        form = change_page.forms["ofdigidconfig_form"]
-        _set_arrayfields(form, self.config)
+        form = change_page.forms[self.form_id]
+        _set_json_widget_fields(form, self.json_widget_values)
 
         # disable the backend
         form["enabled"] = False
@@ -76,11 +93,11 @@ class DigiDConfigAdminTests(AdminTestsBase):
         self.assertFalse(self.config.enabled)
 
     def test_cannot_disable_backend_if_used_in_any_form(self):
-        FormFactory.create(authentication_backends=["digid_oidc"])
+        FormFactory.create(authentication_backends=[self.authentication_backend])
         change_page = self.app.get(self.CHANGE_PAGE_URL, user=self.user)
 
-        form = change_page.forms["ofdigidconfig_form"]
-        _set_arrayfields(form, self.config)
+        form = change_page.forms[self.form_id]
+        _set_json_widget_fields(form, self.json_widget_values)
 
         # disable the backend
         form["enabled"] = False
@@ -90,12 +107,18 @@ class DigiDConfigAdminTests(AdminTestsBase):
         self.config.refresh_from_db()
         self.assertTrue(self.config.enabled)
 
+
+class DigiDConfigAdminTests(ConfigAdminTestsMixin, AdminTestsBase):
+    CHANGE_PAGE_URL = reverse_lazy("admin:digid_eherkenning_oidc_ofdigidconfig_change")
+    config_model = OFDigiDConfig
+    form_id = "ofdigidconfig_form"
+    authentication_backend = "digid_oidc"
+
     def test_leave_enabled(self):
-        FormFactory.create(authentication_backends=["other-backend"])
         change_page = self.app.get(self.CHANGE_PAGE_URL, user=self.user)
 
-        form = change_page.forms["ofdigidconfig_form"]
-        _set_arrayfields(form, self.config)
+        form = change_page.forms[self.form_id]
+        _set_json_widget_fields(form, self.json_widget_values)
 
         # enable the backend
         form["enabled"] = True
@@ -106,160 +129,28 @@ class DigiDConfigAdminTests(AdminTestsBase):
         self.assertTrue(self.config.enabled)
 
 
-class DigiDMachtigenConfigAdminTests(AdminTestsBase):
+class DigiDMachtigenConfigAdminTests(ConfigAdminTestsMixin, AdminTestsBase):
     CHANGE_PAGE_URL = reverse_lazy(
         "admin:digid_eherkenning_oidc_ofdigidmachtigenconfig_change"
     )
+    config_model = OFDigiDMachtigenConfig
+    form_id = "ofdigidmachtigenconfig_form"
+    authentication_backend = "digid_machtigen_oidc"
 
-    @classmethod
-    def setUpTestData(cls):
-        super().setUpTestData()
 
-        # minimal configuration to pass form validation & not do network IO
-        cls.config = config = OFDigiDMachtigenConfig(
-            enabled=True,
-            oidc_rp_client_id="testclient",
-            oidc_rp_client_secret="secret",
-            oidc_op_authorization_endpoint="http://localhost/oidc/auth",
-            oidc_op_token_endpoint="http://localhost/oidc/token",
-            oidc_op_user_endpoint="http://localhost/oidc/userinfo",
-            oidc_op_logout_endpoint="http://localhost/oidc/logout",
-        )
-        config.save()
-        cls.user = SuperUserFactory.create()
-
-    def test_can_disable_backend_iff_unused_in_forms(self):
-        FormFactory.create(authentication_backends=["other-backend"])
-        change_page = self.app.get(self.CHANGE_PAGE_URL, user=self.user)
-
-        form = change_page.forms["ofdigidmachtigenconfig_form"]
-        _set_arrayfields(form, self.config)
-
-        # disable the backend
-        form["enabled"] = False
-        response = form.submit()
-
-        self.assertEqual(response.status_code, 302)
-        self.config.refresh_from_db()
-        self.assertFalse(self.config.enabled)
-
-    def test_cannot_disable_backend_if_used_in_any_form(self):
-        FormFactory.create(authentication_backends=["digid_machtigen_oidc"])
-        change_page = self.app.get(self.CHANGE_PAGE_URL, user=self.user)
-
-        form = change_page.forms["ofdigidmachtigenconfig_form"]
-        _set_arrayfields(form, self.config)
-
-        # disable the backend
-        form["enabled"] = False
-        response = form.submit()
-
-        self.assertEqual(response.status_code, 200)  # there are validation errors
-        self.config.refresh_from_db()
-        self.assertTrue(self.config.enabled)
-
-
-class EHerkenningConfigAdminTests(AdminTestsBase):
+class EHerkenningConfigAdminTests(ConfigAdminTestsMixin, AdminTestsBase):
     CHANGE_PAGE_URL = reverse_lazy(
         "admin:digid_eherkenning_oidc_ofeherkenningconfig_change"
     )
+    config_model = OFEHerkenningConfig
+    form_id = "ofeherkenningconfig_form"
+    authentication_backend = "eherkenning_oidc"
 
-    @classmethod
-    def setUpTestData(cls):
-        super().setUpTestData()
-
-        # minimal configuration to pass form validation & not do network IO
-        cls.config = config = OFEHerkenningConfig(
-            enabled=True,
-            oidc_rp_client_id="testclient",
-            oidc_rp_client_secret="secret",
-            oidc_op_authorization_endpoint="http://localhost/oidc/auth",
-            oidc_op_token_endpoint="http://localhost/oidc/token",
-            oidc_op_user_endpoint="http://localhost/oidc/userinfo",
-            oidc_op_logout_endpoint="http://localhost/oidc/logout",
-        )
-        config.save()
-        cls.user = SuperUserFactory.create()
-
-    def test_can_disable_backend_iff_unused_in_forms(self):
-        FormFactory.create(authentication_backends=["other-backend"])
-        change_page = self.app.get(self.CHANGE_PAGE_URL, user=self.user)
-
-        form = change_page.forms["ofeherkenningconfig_form"]
-        _set_arrayfields(form, self.config)
-
-        # disable the backend
-        form["enabled"] = False
-        response = form.submit()
-
-        self.assertEqual(response.status_code, 302)
-        self.config.refresh_from_db()
-        self.assertFalse(self.config.enabled)
 
-    def test_cannot_disable_backend_if_used_in_any_form(self):
-        FormFactory.create(authentication_backends=["eherkenning_oidc"])
-        change_page = self.app.get(self.CHANGE_PAGE_URL, user=self.user)
-
-        form = change_page.forms["ofeherkenningconfig_form"]
-        _set_arrayfields(form, self.config)
-
-        # disable the backend
-        form["enabled"] = False
-        response = form.submit()
-
-        self.assertEqual(response.status_code, 200)  # there are validation errors
-        self.config.refresh_from_db()
-        self.assertTrue(self.config.enabled)
-
-
-class EHerkenningBewindvoeringConfigAdminTests(AdminTestsBase):
+class EHerkenningBewindvoeringConfigAdminTests(ConfigAdminTestsMixin, AdminTestsBase):
     CHANGE_PAGE_URL = reverse_lazy(
         "admin:digid_eherkenning_oidc_ofeherkenningbewindvoeringconfig_change"
     )
-
-    @classmethod
-    def setUpTestData(cls):
-        super().setUpTestData()
-
-        # minimal configuration to pass form validation & not do network IO
-        cls.config = config = OFEHerkenningBewindvoeringConfig(
-            enabled=True,
-            oidc_rp_client_id="testclient",
-            oidc_rp_client_secret="secret",
-            oidc_op_authorization_endpoint="http://localhost/oidc/auth",
-            oidc_op_token_endpoint="http://localhost/oidc/token",
-            oidc_op_user_endpoint="http://localhost/oidc/userinfo",
-            oidc_op_logout_endpoint="http://localhost/oidc/logout",
-        )
-        config.save()
-        cls.user = SuperUserFactory.create()
-
-    def test_can_disable_backend_iff_unused_in_forms(self):
-        FormFactory.create(authentication_backends=["other-backend"])
-        change_page = self.app.get(self.CHANGE_PAGE_URL, user=self.user)
-
-        form = change_page.forms["ofeherkenningbewindvoeringconfig_form"]
-        _set_arrayfields(form, self.config)
-
-        # disable the backend
-        form["enabled"] = False
-        response = form.submit()
-
-        self.assertEqual(response.status_code, 302)
-        self.config.refresh_from_db()
-        self.assertFalse(self.config.enabled)
-
-    def test_cannot_disable_backend_if_used_in_any_form(self):
-        FormFactory.create(authentication_backends=["eherkenning_bewindvoering_oidc"])
-        change_page = self.app.get(self.CHANGE_PAGE_URL, user=self.user)
-
-        form = change_page.forms["ofeherkenningbewindvoeringconfig_form"]
-        _set_arrayfields(form, self.config)
-
-        # disable the backend
-        form["enabled"] = False
-        response = form.submit()
-
-        self.assertEqual(response.status_code, 200)  # there are validation errors
-        self.config.refresh_from_db()
-        self.assertTrue(self.config.enabled)
+    config_model = OFEHerkenningBewindvoeringConfig
+    form_id = "ofeherkenningbewindvoeringconfig_form"
+    authentication_backend = "eherkenning_bewindvoering_oidc"
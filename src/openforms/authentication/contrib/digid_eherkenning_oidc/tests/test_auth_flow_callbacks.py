@@ -13,7 +13,6 @@ to bring up a Keycloak instance.
 
 from django.test import override_settings, tag
 
-import requests
 from furl import furl
 from rest_framework.reverse import reverse
 
@@ -24,7 +23,7 @@ from openforms.authentication.views import BACKEND_OUTAGE_RESPONSE_PARAMETER
 from openforms.forms.tests.factories import FormFactory
 from openforms.submissions.models import Submission
 from openforms.utils.tests.feature_flags import enable_feature_flag
-from openforms.utils.tests.keycloak import keycloak_login
+from openforms.utils.tests.keycloak import KEYCLOAK_BASE_URL, keycloak_login
 
 from .base import (
     IntegrationTestsBase,
@@ -35,15 +34,35 @@ from .base import (
 )
 
 
+def get_callback_url(start_response) -> furl:
+    """
+    Build the callback URL the identity provider redirects back to.
+
+    The authentication request already contains the ``redirect_uri`` and ``state``,
+    so there's no need to hit Keycloak just to obtain its redirect.
+    """
+    auth_request = furl(start_response["Location"])
+    # check our assumptions/expectations before proceeding
+    assert auth_request.copy().remove(query=True).url == f"{KEYCLOAK_BASE_URL}/auth"
+    callback_url = furl(auth_request.args["redirect_uri"])
+    callback_url.args["state"] = auth_request.args["state"]
+    return callback_url
+
+
 class DigiDCallbackTests(IntegrationTestsBase):
     """
     Test the return/callback side after authenticating with the identity provider.
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create(authentication_backends=["digid_oidc"])
+
     @mock_digid_config()
     def test_redirects_after_successful_auth(self):
-        form = FormFactory.create(authentication_backends=["digid_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="digid_oidc")
         start_response = self.app.get(start_url)
 
@@ -57,8 +76,7 @@ class DigiDCallbackTests(IntegrationTestsBase):
 
     @mock_digid_config(bsn_claim=["absent-claim"])
     def test_failing_claim_verification(self):
-        form = FormFactory.create(authentication_backends=["digid_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="digid_oidc")
         start_response = self.app.get(start_url)
         # simulate login to Keycloak
@@ -76,20 +94,15 @@ class DigiDCallbackTests(IntegrationTestsBase):
         self.assertNotIn(FORM_AUTH_SESSION_KEY, self.app.session)
 
     @tag("gh-3656", "gh-3692")
-    @mock_digid_config(oidc_rp_scopes_list=["badscope"])
+    @mock_digid_config()
     def test_digid_error_reported_for_cancelled_login_anon_django_user(self):
-        form = FormFactory.create(authentication_backends=["digid_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="digid_oidc")
-        # initialize state, but don't actually log in - we have an invalid config and
-        # keycloak redirects back to our callback URL with error parameters.
+        # initialize state, but don't actually log in - instead, simulate the identity
+        # provider redirecting back to our callback URL with error parameters.
         start_response = self.app.get(start_url)
-        auth_response = requests.get(start_response["Location"], allow_redirects=False)
-        # check out assumptions/expectations before proceeding
-        callback_url = furl(auth_response.headers["Location"])
-        assert callback_url.netloc == "testserver"
-        assert "state" in callback_url.args
-        # modify the error parameters - there doesn't seem to be an obvious way to trigger
+        callback_url = get_callback_url(start_response)
+        # add the error parameters - there doesn't seem to be an obvious way to trigger
         # this via keycloak itself.
         # Note: this is an example of a specific provider. It may differ when a
         # different provider is used. According to
@@ -110,20 +123,15 @@ class DigiDCallbackTests(IntegrationTestsBase):
         self.assertEqual(callback_response.request.url, str(expected_url))
 
     @tag("gh-3656", "gh-3692")
-    @mock_digid_config(oidc_rp_scopes_list=["badscope"])
+    @mock_digid_config()
     def test_digid_error_reported_for_cancelled_login_with_staff_django_user(self):
         self.app.set_user(StaffUserFactory.create())
-        form = FormFactory.create(authentication_backends=["digid_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="digid_oidc")
-        # initialize state, but don't actually log in - we have an invalid config and
-        # keycloak redirects back to our callback URL with error parameters.
+        # initialize state, but don't actually log in - instead, simulate the identity
+        # provider redirecting back to our callback URL with error parameters.
         start_response = self.app.get(start_url)
-        auth_response = requests.get(start_response["Location"], allow_redirects=False)
-        # check out assumptions/expectations before proceeding
-        callback_url = furl(auth_response.headers["Location"])
-        assert callback_url.netloc == "testserver"
-        assert "state" in callback_url.args
+        callback_url = get_callback_url(start_response)
         callback_url.args.update(
             {"error": "access_denied", "error_description": "The user cancelled"}
         )
@@ -143,10 +151,15 @@ class EHerkenningCallbackTests(IntegrationTestsBase):
     Test the return/callback side after authenticating with the identity provider.
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create(authentication_backends=["eherkenning_oidc"])
+
     @mock_eherkenning_config()
     def test_redirects_after_successful_auth(self):
-        form = FormFactory.create(authentication_backends=["eherkenning_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="eherkenning_oidc")
         start_response = self.app.get(start_url)
 
@@ -161,8 +174,7 @@ class EHerkenningCallbackTests(IntegrationTestsBase):
     @tag("gh-4627")
     @mock_eherkenning_config(acting_subject_claim=["does not exist"])
     def test_failure_with_missing_acting_subject_claim(self):
-        form = FormFactory.create(authentication_backends=["eherkenning_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="eherkenning_oidc")
         start_response = self.app.get(start_url)
 
@@ -182,7 +194,9 @@ class EHerkenningCallbackTests(IntegrationTestsBase):
                 CORS_ALLOWED_ORIGINS=["http://testserver.com"],
             ),
         ):
-            api_path = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+            api_path = reverse(
+                "api:form-detail", kwargs={"uuid_or_slug": self.form.uuid}
+            )
             # make sure csrf cookie is set
             form_detail_response = self.app.get(api_path)
             body = {
@@ -206,8 +220,7 @@ class EHerkenningCallbackTests(IntegrationTestsBase):
     @enable_feature_flag("DIGID_EHERKENNING_OIDC_STRICT")
     @mock_eherkenning_config(acting_subject_claim=["does not exist"])
     def test_failure_with_missing_acting_subject_claim_strict_mode(self):
-        form = FormFactory.create(authentication_backends=["eherkenning_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="eherkenning_oidc")
         start_response = self.app.get(start_url)
         # simulate login to Keycloak
@@ -220,8 +233,7 @@ class EHerkenningCallbackTests(IntegrationTestsBase):
 
     @mock_eherkenning_config(legal_subject_claim=["absent-claim"])
     def test_failing_claim_verification(self):
-        form = FormFactory.create(authentication_backends=["eherkenning_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="eherkenning_oidc")
         start_response = self.app.get(start_url)
         # simulate login to Keycloak
@@ -239,20 +251,15 @@ class EHerkenningCallbackTests(IntegrationTestsBase):
         self.assertNotIn(FORM_AUTH_SESSION_KEY, self.app.session)
 
     @tag("gh-3656", "gh-3692")
-    @mock_eherkenning_config(oidc_rp_scopes_list=["badscope"])
+    @mock_eherkenning_config()
     def test_eherkenning_error_reported_for_cancelled_login_anon_django_user(self):
-        form = FormFactory.create(authentication_backends=["eherkenning_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="eherkenning_oidc")
-        # initialize state, but don't actually log in - we have an invalid config and
-        # keycloak redirects back to our callback URL with error parameters.
+        # initialize state, but don't actually log in - instead, simulate the identity
+        # provider redirecting back to our callback URL with error parameters.
         start_response = self.app.get(start_url)
-        auth_response = requests.get(start_response["Location"], allow_redirects=False)
-        # check out assumptions/expectations before proceeding
-        callback_url = furl(auth_response.headers["Location"])
-        assert callback_url.netloc == "testserver"
-        assert "state" in callback_url.args
-        # modify the error parameters - there doesn't seem to be an obvious way to trigger
+        callback_url = get_callback_url(start_response)
+        # add the error parameters - there doesn't seem to be an obvious way to trigger
         # this via keycloak itself.
         # Note: this is an example of a specific provider. It may differ when a
         # different provider is used. According to
@@ -273,22 +280,17 @@ class EHerkenningCallbackTests(IntegrationTestsBase):
         self.assertEqual(callback_response.request.url, str(expected_url))
 
     @tag("gh-3656", "gh-3692")
-    @mock_eherkenning_config(oidc_rp_scopes_list=["badscope"])
+    @mock_eherkenning_config()
     def test_eherkenning_error_reported_for_cancelled_login_with_staff_django_user(
         self,
     ):
         self.app.set_user(StaffUserFactory.create())
-        form = FormFactory.create(authentication_backends=["eherkenning_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="eherkenning_oidc")
-        # initialize state, but don't actually log in - we have an invalid config and
-        # keycloak redirects back to our callback URL with error parameters.
+        # initialize state, but don't actually log in - instead, simulate the identity
+        # provider redirecting back to our callback URL with error parameters.
         start_response = self.app.get(start_url)
-        auth_response = requests.get(start_response["Location"], allow_redirects=False)
-        # check out assumptions/expectations before proceeding
-        callback_url = furl(auth_response.headers["Location"])
-        assert callback_url.netloc == "testserver"
-        assert "state" in callback_url.args
+        callback_url = get_callback_url(start_response)
         callback_url.args.update(
             {"error": "access_denied", "error_description": "The user cancelled"}
         )
@@ -308,10 +310,15 @@ class DigiDMachtigenCallbackTests(IntegrationTestsBase):
     Test the return/callback side after authenticating with the identity provider.
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create(authentication_backends=["digid_machtigen_oidc"])
+
     @mock_digid_machtigen_config()
     def test_redirects_after_successful_auth(self):
-        form = FormFactory.create(authentication_backends=["digid_machtigen_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="digid_machtigen_oidc")
         start_response = self.app.get(start_url)
 
@@ -332,8 +339,7 @@ class DigiDMachtigenCallbackTests(IntegrationTestsBase):
         authorizee_bsn_claim=["absent-claim"],
     )
     def test_failing_claim_verification(self):
-        form = FormFactory.create(authentication_backends=["digid_machtigen_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="digid_machtigen_oidc")
         start_response = self.app.get(start_url)
         # simulate login to Keycloak
@@ -357,8 +363,7 @@ class DigiDMachtigenCallbackTests(IntegrationTestsBase):
     @enable_feature_flag("DIGID_EHERKENNING_OIDC_STRICT")
     @mock_digid_machtigen_config(mandate_service_id_claim=["absent-claim"])
     def test_failing_claim_verification_strict_mode(self):
-        form = FormFactory.create(authentication_backends=["digid_machtigen_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="digid_machtigen_oidc")
         start_response = self.app.get(start_url)
         # simulate login to Keycloak
@@ -380,20 +385,15 @@ class DigiDMachtigenCallbackTests(IntegrationTestsBase):
         self.assertNotIn(FORM_AUTH_SESSION_KEY, self.app.session)
 
     @tag("gh-3656", "gh-3692")
-    @mock_digid_machtigen_config(oidc_rp_scopes_list=["badscope"])
+    @mock_digid_machtigen_config()
     def test_digid_error_reported_for_cancelled_login_anon_django_user(self):
-        form = FormFactory.create(authentication_backends=["digid_machtigen_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="digid_machtigen_oidc")
-        # initialize state, but don't actually log in - we have an invalid config and
-        # keycloak redirects back to our callback URL with error parameters.
+        # initialize state, but don't actually log in - instead, simulate the identity
+        # provider redirecting back to our callback URL with error parameters.
         start_response = self.app.get(start_url)
-        auth_response = requests.get(start_response["Location"], allow_redirects=False)
-        # check out assumptions/expectations before proceeding
-        callback_url = furl(auth_response.headers["Location"])
-        assert callback_url.netloc == "testserver"
-        assert "state" in callback_url.args
-        # modify the error parameters - there doesn't seem to be an obvious way to trigger
+        callback_url = get_callback_url(start_response)
+        # add the error parameters - there doesn't seem to be an obvious way to trigger
         # this via keycloak itself.
         # Note: this is an example of a specific provider. It may differ when a
         # different provider is used. According to
@@ -414,20 +414,15 @@ class DigiDMachtigenCallbackTests(IntegrationTestsBase):
         self.assertEqual(callback_response.request.url, str(expected_url))
 
     @tag("gh-3656", "gh-3692")
-    @mock_digid_machtigen_config(oidc_rp_scopes_list=["badscope"])
+    @mock_digid_machtigen_config()
     def test_digid_error_reported_for_cancelled_login_with_staff_django_user(self):
         self.app.set_user(StaffUserFactory.create())
-        form = FormFactory.create(authentication_backends=["digid_machtigen_oidc"])
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(plugin_id="digid_machtigen_oidc")
-        # initialize state, but don't actually log in - we have an invalid config and
-        # keycloak redirects back to our callback URL with error parameters.
+        # initialize state, but don't actually log in - instead, simulate the identity
+        # provider redirecting back to our callback URL with error parameters.
         start_response = self.app.get(start_url)
-        auth_response = requests.get(start_response["Location"], allow_redirects=False)
-        # check out assumptions/expectations before proceeding
-        callback_url = furl(auth_response.headers["Location"])
-        assert callback_url.netloc == "testserver"
-        assert "state" in callback_url.args
+        callback_url = get_callback_url(start_response)
         callback_url.args.update(
             {"error": "access_denied", "error_description": "The user cancelled"}
         )
@@ -447,12 +442,17 @@ class EHerkenningBewindvoeringCallbackTests(IntegrationTestsBase):
     Test the return/callback side after authenticating with the identity provider.
     """
 
-    @mock_eherkenning_bewindvoering_config()
-    def test_redirects_after_successful_auth(self):
-        form = FormFactory.create(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create(
             authentication_backends=["eherkenning_bewindvoering_oidc"]
         )
-        url_helper = URLsHelper(form=form)
+
+    @mock_eherkenning_bewindvoering_config()
+    def test_redirects_after_successful_auth(self):
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(
             plugin_id="eherkenning_bewindvoering_oidc"
         )
@@ -475,10 +475,7 @@ class EHerkenningBewindvoeringCallbackTests(IntegrationTestsBase):
         representee_claim=["absent-claim"],
     )
     def test_failing_claim_verification(self):
-        form = FormFactory.create(
-            authentication_backends=["eherkenning_bewindvoering_oidc"]
-        )
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(
             plugin_id="eherkenning_bewindvoering_oidc"
         )
@@ -502,24 +499,17 @@ class EHerkenningBewindvoeringCallbackTests(IntegrationTestsBase):
         self.assertNotIn(FORM_AUTH_SESSION_KEY, self.app.session)
 
     @tag("gh-3656", "gh-3692")
-    @mock_eherkenning_bewindvoering_config(oidc_rp_scopes_list=["badscope"])
+    @mock_eherkenning_bewindvoering_config()
     def test_eherkenning_error_reported_for_cancelled_login_anon_django_user(self):
-        form = FormFactory.create(
-            authentication_backends=["eherkenning_bewindvoering_oidc"]
-        )
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(
             plugin_id="eherkenning_bewindvoering_oidc"
         )
-        # initialize state, but don't actually log in - we have an invalid config and
-        # keycloak redirects back to our callback URL with error parameters.
+        # initialize state, but don't actually log in - instead, simulate the identity
+        # provider redirecting back to our callback URL with error parameters.
         start_response = self.app.get(start_url)
-        auth_response = requests.get(start_response["Location"], allow_redirects=False)
-        # check out assumptions/expectations before proceeding
-        callback_url = furl(auth_response.headers["Location"])
-        assert callback_url.netloc == "testserver"
-        assert "state" in callback_url.args
-        # modify the error parameters - there doesn't seem to be an obvious way to trigger
+        callback_url = get_callback_url(start_response)
+        # add the error parameters - there doesn't seem to be an obvious way to trigger
         # this via keycloak itself.
         # Note: this is an example of a specific provider. It may differ when a
         # different provider is used. According to
@@ -540,26 +530,19 @@ class EHerkenningBewindvoeringCallbackTests(IntegrationTestsBase):
         self.assertEqual(callback_response.request.url, str(expected_url))
 
     @tag("gh-3656", "gh-3692")
-    @mock_eherkenning_bewindvoering_config(oidc_rp_scopes_list=["badscope"])
+    @mock_eherkenning_bewindvoering_config()
     def test_eherkenning_error_reported_for_cancelled_login_with_staff_django_user(
         self,
     ):
         self.app.set_user(StaffUserFactory.create())
-        form = FormFactory.create(
-            authentication_backends=["eherkenning_bewindvoering_oidc"]
-        )
-        url_helper = URLsHelper(form=form)
+        url_helper = URLsHelper(form=self.form)
         start_url = url_helper.get_auth_start(
             plugin_id="eherkenning_bewindvoering_oidc"
         )
-        # initialize state, but don't actually log in - we have an invalid config and
-        # keycloak redirects back to our callback URL with error parameters.
+        # initialize state, but don't actually log in - instead, simulate the identity
+        # provider redirecting back to our callback URL with error parameters.
         start_response = self.app.get(start_url)
-        auth_response = requests.get(start_response["Location"], allow_redirects=False)
-        # check out assumptions/expectations before proceeding
-        callback_url = furl(auth_response.headers["Location"])
-        assert callback_url.netloc == "testserver"
-        assert "state" in callback_url.args
+        callback_url = get_callback_url(start_response)
         callback_url.args.update(
             {"error": "access_denied", "error_description": "The user cancelled"}
         )
@@ -11,9 +11,9 @@ from digid_eherkenning.choices import AssuranceLevels, ConfigTypes, XMLContentTy
 from digid_eherkenning.models import ConfigCertificate, EherkenningConfiguration
 from freezegun import freeze_time
 from furl import furl
+from lxml import html
 from privates.test import temp_private_root
 from simple_certmanager.test.factories import CertificateFactory
-from webtest.forms import Form as WTForm
 
 from openforms.forms.tests.factories import FormStepFactory
 from openforms.submissions.tests.factories import SubmissionFactory
@@ -396,9 +396,9 @@ Response: TypeAlias = TemplateResponse | requests.Response
 
 def _parse_form(response: Response) -> tuple[Method, str, dict[str, str]]:
     "Extract method, action URL and form values from html content"
-    form = WTForm(None, response.content)
+    form = html.fromstring(response.content).forms[0]
     url = form.action or response.url
     assert url, f"No url found in {form}"
-    method = form.method
+    method = form.method.lower()
     assert method in ("get", "post")
-    return method, url, dict(form.submit_fields())
+    return method, url, dict(form.form_values())
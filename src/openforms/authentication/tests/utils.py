@@ -1,4 +1,5 @@
 import json
+from functools import cached_property
 from pathlib import Path
 
 from django.urls import reverse
@@ -13,17 +14,19 @@ from openforms.forms.models import Form
 class URLsHelper:
     """
     Small helper to get the right frontend URLs for authentication flows.
+
+    The URLs are computed once per helper instance.
     """
 
     def __init__(self, form: Form, host: str = "http://testserver"):
         self.form = form
         self.host = host
 
-    @property
+    @cached_property
     def form_path(self) -> str:
         return reverse("core:form-detail", kwargs={"slug": self.form.slug})
 
-    @property
+    @cached_property
     def frontend_start(self) -> str:
         """
         Compute the frontend URL that will trigger a submissions start.
@@ -31,7 +34,7 @@ class URLsHelper:
         form_url = furl(f"{self.host}{self.form_path}").set({"_start": "1"})
         return str(form_url)
 
-    @property
+    @cached_property
     def api_resource(self) -> str:
         api_path = reverse("api:form-detail", kwargs={"uuid_or_slug": self.form.uuid})
         return f"{self.host}{api_path}"
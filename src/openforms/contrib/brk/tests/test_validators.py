@@ -8,6 +8,7 @@ import requests_mock
 from privates.test import temp_private_root
 
 from openforms.authentication.service import AuthAttribute
+from openforms.authentication.tests.factories import AuthInfoFactory
 from openforms.contrib.brk.models import BRKConfig
 from openforms.pre_requests.base import PreRequestHookBase
 from openforms.pre_requests.registry import Registry
@@ -22,73 +23,75 @@ from .base import TEST_FILES, BRKTestMixin
 class BRKValidatorTestCase(BRKTestMixin, OFVCRMixin, TestCase):
     VCR_TEST_FILES = TEST_FILES
 
-    def test_brk_validator_no_auth(self):
-        validator = BRKZakelijkGerechtigdeValidator("brk_validator")
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
 
-        submission_no_auth = SubmissionFactory.create(
+        cls.submission_wrong_bsn = SubmissionFactory.create(
             form__generate_minimal_setup=True,
+            form__authentication_backends=["demo"],
+            form__formstep__form_definition__login_required=False,
+            auth_info__attribute_hashed=False,
+            auth_info__attribute=AuthAttribute.bsn,
+            auth_info__value="wrong_bsn",
+            auth_info__plugin="demo",
+        )
+        cls.submission_bsn = SubmissionFactory.create(
+            form__generate_minimal_setup=True,
+            form__authentication_backends=["demo"],
+            form__formstep__form_definition__login_required=False,
+            auth_info__attribute_hashed=False,
+            auth_info__attribute=AuthAttribute.bsn,
+            auth_info__value="71291440",
+            auth_info__plugin="demo",
         )
 
+    def test_brk_validator_no_auth(self):
+        validator = BRKZakelijkGerechtigdeValidator("brk_validator")
+        # the validator bails out before any database access, no need to persist
+        submission_no_auth = SubmissionFactory.build()
+
         with self.assertRaisesMessage(
             ValidationError, _("No BSN is available to validate your address.")
         ):
             validator(
-                {"postcode": "not_relevant", "houseNumber": "same"}, submission_no_auth
+                {"postcode": "not_relevant", "houseNumber": "same"},
+                submission_no_auth,
             )
 
     def test_brk_validator_no_bsn(self):
         validator = BRKZakelijkGerechtigdeValidator("brk_validator")
-
-        submission_no_bsn = SubmissionFactory.create(
-            form__generate_minimal_setup=True,
-            form__authentication_backends=["demo"],
-            auth_info__plugin="demo",
-            auth_info__attribute=AuthAttribute.kvk,
-        )
+        # the validator bails out before any database access, no need to persist
+        submission_no_bsn = AuthInfoFactory.build(
+            plugin="demo", attribute=AuthAttribute.kvk
+        ).submission
 
         with self.assertRaisesMessage(
             ValidationError, _("No BSN is available to validate your address.")
         ):
             validator(
-                {"postcode": "not_relevant", "houseNumber": "same"}, submission_no_bsn
+                {"postcode": "not_relevant", "houseNumber": "same"},
+                submission_no_bsn,
             )
 
     def test_brk_validator_wrong_bsn(self):
         validator = BRKZakelijkGerechtigdeValidator("brk_validator")
 
-        submission_wrong_bsn = SubmissionFactory.create(
-            form__generate_minimal_setup=True,
-            form__authentication_backends=["demo"],
-            form__formstep__form_definition__login_required=False,
-            auth_info__attribute_hashed=False,
-            auth_info__attribute=AuthAttribute.bsn,
-            auth_info__value="wrong_bsn",
-            auth_info__plugin="demo",
-        )
-
         with self.assertRaisesMessage(
             ValidationError,
             _("According to our records, you are not a legal owner of this property."),
         ):
-            validator({"postcode": "7361EW", "houseNumber": "21"}, submission_wrong_bsn)
+            validator(
+                {"postcode": "7361EW", "houseNumber": "21"}, self.submission_wrong_bsn
+            )
 
     def test_brk_validator_bsn(self):
         validator = BRKZakelijkGerechtigdeValidator("brk_validator")
 
-        submission_bsn = SubmissionFactory.create(
-            form__generate_minimal_setup=True,
-            form__authentication_backends=["demo"],
-            form__formstep__form_definition__login_required=False,
-            auth_info__attribute_hashed=False,
-            auth_info__attribute=AuthAttribute.bsn,
-            auth_info__value="71291440",
-            auth_info__plugin="demo",
-        )
-
         with self.assertRaisesMessage(
             ValidationError, _("No property found for this address.")
         ):
-            validator({"postcode": "1234AA", "houseNumber": "1"}, submission_bsn)
+            validator({"postcode": "1234AA", "houseNumber": "1"}, self.submission_bsn)
 
         with self.assertRaisesMessage(
             ValidationError, _("No property found for this address.")
@@ -100,11 +103,11 @@ class BRKValidatorTestCase(BRKTestMixin, OFVCRMixin, TestCase):
                     "houseLetter": "A",
                     "houseNumberAddition": "B",
                 },
-                submission_bsn,
+                self.submission_bsn,
             )
 
         try:
-            validator({"postcode": "7361EW", "houseNumber": "21"}, submission_bsn)
+            validator({"postcode": "7361EW", "houseNumber": "21"}, self.submission_bsn)
         except ValidationError as exc:
             raise self.failureException(
                 "Input data unexpectedly did not validate"
@@ -114,16 +117,6 @@ class BRKValidatorTestCase(BRKTestMixin, OFVCRMixin, TestCase):
     def test_brk_validator_requests_error(self, m: requests_mock.Mocker):
         validator = BRKZakelijkGerechtigdeValidator("brk_validator")
 
-        submission_bsn = SubmissionFactory.create(
-            form__generate_minimal_setup=True,
-            form__authentication_backends=["demo"],
-            form__formstep__form_definition__login_required=False,
-            auth_info__attribute_hashed=False,
-            auth_info__attribute=AuthAttribute.bsn,
-            auth_info__value="71291440",
-            auth_info__plugin="demo",
-        )
-
         m.get(
             "https://api.brk.kadaster.nl/esd-eto-apikey/bevragen/v2/kadastraalonroerendezaken?postcode=1234AA&huisnummer=1",
             status_code=400,
@@ -135,7 +128,7 @@ class BRKValidatorTestCase(BRKTestMixin, OFVCRMixin, TestCase):
                 "There was an error while retrieving the available properties. Please try again later."
             ),
         ):
-            validator({"postcode": "1234AA", "houseNumber": "1"}, submission_bsn)
+            validator({"postcode": "1234AA", "houseNumber": "1"}, self.submission_bsn)
 
     def test_pre_request_hooks_called(self):
         pre_req_register = Registry()
@@ -147,18 +140,9 @@ class BRKValidatorTestCase(BRKTestMixin, OFVCRMixin, TestCase):
                 mock(*args, **kwargs)
 
         validator = BRKZakelijkGerechtigdeValidator("brk_validator")
-        submission_bsn = SubmissionFactory.create(
-            form__generate_minimal_setup=True,
-            form__authentication_backends=["demo"],
-            form__formstep__form_definition__login_required=False,
-            auth_info__attribute_hashed=False,
-            auth_info__attribute=AuthAttribute.bsn,
-            auth_info__value="71291440",
-            auth_info__plugin="demo",
-        )
 
         with patch("openforms.pre_requests.clients.registry", new=pre_req_register):
-            validator({"postcode": "7361EW", "houseNumber": "21"}, submission_bsn)
+            validator({"postcode": "7361EW", "houseNumber": "21"}, self.submission_bsn)
 
         self.assertEqual(mock.call_count, 2)  # 2 API calls expected
         context = mock.call_args.kwargs["context"]
@@ -16,13 +16,13 @@ from furl import furl
 from json_logic.typing import JSON
 from rest_framework import serializers
 from simple_certmanager.models import Certificate
+from zgw_consumers.models import Service
 
 from openforms.contrib.brk.service import check_brk_config_for_addressNL
 from openforms.contrib.kadaster.service import check_bag_config_for_address_fields
 from openforms.forms.constants import LogicActionTypes
 from openforms.forms.models import Form
 from openforms.forms.models.form_registration_backend import FormRegistrationBackend
-from openforms.forms.models.logic import FormLogic
 from openforms.logging.models import TimelineLogProxy
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.registrations.registry import register
@@ -34,6 +34,7 @@ from openforms.utils.json_logic.introspection import introspect_json_logic
 from openforms.utils.urls import build_absolute_uri
 from openforms.variables.constants import FormVariableDataTypes
 from openforms.variables.service import get_static_variables
+from soap.models import SoapService
 
 logger = logging.getLogger(__name__)
 
@@ -164,10 +165,14 @@ def collect_failed_emails(since: datetime) -> Iterable[FailedEmail]:
 def collect_failed_registrations(
     since: datetime,
 ) -> list[FailedRegistration]:
-    logs = TimelineLogProxy.objects.filter(
-        timestamp__gt=since,
-        extra_data__log_event="registration_failure",
-    ).order_by("timestamp")
+    logs = (
+        TimelineLogProxy.objects.filter(
+            timestamp__gt=since,
+            extra_data__log_event="registration_failure",
+        )
+        .prefetch_related("content_object__form")
+        .order_by("timestamp")
+    )
 
     form_sorted_logs = sorted(logs, key=lambda x: x.content_object.form.admin_name)
 
@@ -200,13 +205,17 @@ def collect_failed_registrations(
 
 
 def collect_failed_prefill_plugins(since: datetime) -> list[FailedPrefill]:
-    logs = TimelineLogProxy.objects.filter(
-        timestamp__gt=since,
-        extra_data__log_event__in=[
-            "prefill_retrieve_empty",
-            "prefill_retrieve_failure",
-        ],
-    ).order_by("extra_data__plugin_label")
+    logs = (
+        TimelineLogProxy.objects.filter(
+            timestamp__gt=since,
+            extra_data__log_event__in=[
+                "prefill_retrieve_empty",
+                "prefill_retrieve_failure",
+            ],
+        )
+        .prefetch_related("content_object__form")
+        .order_by("extra_data__plugin_label")
+    )
 
     grouped_logs = groupby(logs, key=lambda x: x.extra_data["plugin_label"])
 
@@ -271,11 +280,13 @@ def collect_invalid_certificates() -> list[InvalidCertificate]:
 
     invalid_certs = []
     # filter only on the certificates that are used by services
+    # use subqueries rather than joins, so that certificates used by multiple
+    # services are only checked (and reported) once
     configured_certificates = Certificate.objects.filter(
-        Q(soap_services_client__isnull=False)
-        | Q(soap_services_server__isnull=False)
-        | Q(service_client__isnull=False)
-        | Q(service_server__isnull=False)
+        Q(pk__in=SoapService.objects.values("client_certificate"))
+        | Q(pk__in=SoapService.objects.values("server_certificate"))
+        | Q(pk__in=Service.objects.values("client_certificate"))
+        | Q(pk__in=Service.objects.values("server_certificate"))
     )
     for cert in configured_certificates:
         time_until_expiry = cert.expiry_date - today
@@ -398,7 +409,11 @@ def collect_invalid_logic_rules() -> list[InvalidLogicRule]:
             )
         )
 
-    forms = Form.objects.live().iterator()
+    forms = (
+        Form.objects.live()
+        .prefetch_related("formvariable_set", "formlogic_set")
+        .iterator(chunk_size=100)
+    )
     static_variables = {
         var.key: {"source": var.source, "type": var.data_type}
         for var in get_static_variables()
@@ -414,9 +429,9 @@ def collect_invalid_logic_rules() -> list[InvalidLogicRule]:
             for form_variable in form.formvariable_set.all()
         }
 
-        all_keys = list(static_variables) + list(form_variables)
+        all_keys = static_variables.keys() | form_variables.keys()
 
-        form_logics = FormLogic.objects.filter(form=form)
+        form_logics = form.formlogic_set.all()
 
         form_logics_vars = []
         for index, logic in enumerate(form_logics):
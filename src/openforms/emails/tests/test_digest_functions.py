@@ -3,7 +3,9 @@ from pathlib import Path
 from unittest.mock import patch
 
 from django.core.files import File
+from django.db import connection
 from django.test import TestCase, override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import utc
 
 import requests_mock
@@ -33,6 +35,7 @@ from openforms.submissions.constants import RegistrationStatuses
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.utils.mixins import JsonSchemaSerializerMixin
 from openforms.variables.constants import FormVariableDataTypes
+from soap.tests.factories import SoapServiceFactory
 from stuf.stuf_bg.client import NoServiceConfigured
 
 from ..digest import (
@@ -173,6 +176,31 @@ class FailedRegistrationsTests(TestCase):
         self.assertEqual(failed_registrations[0].failed_submissions_counter, 2)
         self.assertEqual(failed_registrations[1].failed_submissions_counter, 1)
 
+    def test_query_count_does_not_grow_with_failed_registrations(self):
+        since = datetime(2023, 1, 1, 14, 30, 0).replace(tzinfo=utc)
+
+        def log_failure():
+            submission = SubmissionFactory.create(
+                registration_status=RegistrationStatuses.failed
+            )
+            logevent.registration_failure(
+                submission, RegistrationFailed("Registration plugin is not enabled")
+            )
+
+        log_failure()
+        # warm up the content type cache
+        collect_failed_registrations(since=since)
+        with CaptureQueriesContext(connection) as few_failures:
+            collect_failed_registrations(since=since)
+
+        for _ in range(5):
+            log_failure()
+        with CaptureQueriesContext(connection) as many_failures:
+            failed_registrations = collect_failed_registrations(since=since)
+
+        self.assertEqual(len(failed_registrations), 6)
+        self.assertEqual(len(many_failures), len(few_failures))
+
     def test_timestamp_constraint_returns_no_results(self):
         form = FormFactory.create()
         submission = SubmissionFactory.create(form=form, registration_failed=True)
@@ -227,6 +255,32 @@ class FailedPrefillTests(TestCase):
         self.assertEqual(failed_plugins[0].failed_submissions_counter, 2)
         self.assertEqual(failed_plugins[1].failed_submissions_counter, 1)
 
+    def test_query_count_does_not_grow_with_prefill_failures(self):
+        hc_plugin = prefill_register["haalcentraal"]
+        since = datetime(2023, 1, 2, 2, 0, 0).replace(tzinfo=utc)
+
+        def log_failure():
+            submission = SubmissionFactory.create()
+            logevent.prefill_retrieve_empty(
+                submission, hc_plugin, ["burgerservicenummer"]
+            )
+
+        log_failure()
+        # warm up the content type cache
+        collect_failed_prefill_plugins(since=since)
+        with CaptureQueriesContext(connection) as few_failures:
+            collect_failed_prefill_plugins(since=since)
+
+        for _ in range(5):
+            log_failure()
+        with CaptureQueriesContext(connection) as many_failures:
+            failed_plugins = collect_failed_prefill_plugins(since=since)
+
+        self.assertEqual(len(failed_plugins), 1)
+        self.assertEqual(failed_plugins[0].failed_submissions_counter, 6)
+        self.assertEqual(len(failed_plugins[0].form_names), 6)
+        self.assertEqual(len(many_failures), len(few_failures))
+
     def test_timestamp_constraint_returns_no_results(self):
         hc_plugin = prefill_register["haalcentraal"]
 
@@ -542,6 +596,22 @@ class InvalidCertificatesTests(TestCase):
         self.assertEqual(len(invalid_certificates), 1)
         self.assertEqual(invalid_certificates[0].error_message, "will expire soon")
 
+    def test_certificate_used_by_multiple_services_is_collected_once(self):
+        # the certificate (test.certificate) expires on Apr 22 13:02:55 2025 GMT
+        with open(TEST_FILES / "test.certificate", "r") as client_certificate_f:
+            certificate = CertificateFactory.create(
+                label="Test certificate",
+                public_certificate=File(client_certificate_f, name="test.certificate"),
+            )
+        ServiceFactory.create(client_certificate=certificate)
+        ServiceFactory.create(client_certificate=certificate)
+        SoapServiceFactory.create(client_certificate=certificate)
+
+        with freeze_time("2025-04-15T21:15:00Z"):
+            invalid_certificates = collect_invalid_certificates()
+
+        self.assertEqual(len(invalid_certificates), 1)
+
     def test_invalid_certificates_are_collected(self):
         # the certificate (test.certificate) expires on Apr 22 13:02:55 2025 GMT and
         # test2.certificate on Apr 22 13:05:26 2025 GMT. Here the test.key is not valid
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import patch
 
@@ -27,6 +28,12 @@ from ..stuf_bg import get_np_family_members_stuf_bg
 TEST_FILES = Path(__file__).parent.resolve() / "responses"
 
 
+@lru_cache
+def _load_stuf_bg_response(filename: str) -> bytes:
+    soap_response_template = (TEST_FILES / filename).read_text()
+    return render_from_string(soap_response_template, {}).encode("utf-8")
+
+
 @disable_timelinelog()
 class FamilyMembersCustomFieldTypeTest(TestCase):
     @patch(
@@ -109,10 +116,7 @@ class FamilyMembersCustomFieldTypeTest(TestCase):
     def test_get_children_stuf_bg(self, mock_stufbg_config_get_solo):
         stuf_bg_service = StufServiceFactory.build()
         mock_stufbg_config_get_solo.return_value = StufBGConfig(service=stuf_bg_service)
-        soap_response_template = (TEST_FILES / "stuf_bg_2_children.xml").read_text()
-        response_content = render_from_string(soap_response_template, {}).encode(
-            "utf-8"
-        )
+        response_content = _load_stuf_bg_response("stuf_bg_2_children.xml")
 
         with requests_mock.Mocker() as m:
             m.post(
@@ -133,10 +137,7 @@ class FamilyMembersCustomFieldTypeTest(TestCase):
     def test_get_partners_stuf_bg(self, mock_stufbg_config_get_solo):
         stuf_bg_service = StufServiceFactory.build()
         mock_stufbg_config_get_solo.return_value = StufBGConfig(service=stuf_bg_service)
-        soap_response_template = (TEST_FILES / "stuf_bg_family_members.xml").read_text()
-        response_content = render_from_string(soap_response_template, {}).encode(
-            "utf-8"
-        )
+        response_content = _load_stuf_bg_response("stuf_bg_family_members.xml")
 
         with requests_mock.Mocker() as m:
             m.post(
@@ -157,10 +158,7 @@ class FamilyMembersCustomFieldTypeTest(TestCase):
     def test_get_single_partner_stuf_bg(self, mock_stufbg_config_get_solo):
         stuf_bg_service = StufServiceFactory.build()
         mock_stufbg_config_get_solo.return_value = StufBGConfig(service=stuf_bg_service)
-        soap_response_template = (TEST_FILES / "stuf_bg_one_partner.xml").read_text()
-        response_content = render_from_string(soap_response_template, {}).encode(
-            "utf-8"
-        )
+        response_content = _load_stuf_bg_response("stuf_bg_one_partner.xml")
 
         with requests_mock.Mocker() as m:
             m.post(
@@ -179,10 +177,7 @@ class FamilyMembersCustomFieldTypeTest(TestCase):
     def test_get_family_memebers_stuf_bg(self, mock_stufbg_config_get_solo):
         stuf_bg_service = StufServiceFactory.build()
         mock_stufbg_config_get_solo.return_value = StufBGConfig(service=stuf_bg_service)
-        soap_response_template = (TEST_FILES / "stuf_bg_family_members.xml").read_text()
-        response_content = render_from_string(soap_response_template, {}).encode(
-            "utf-8"
-        )
+        response_content = _load_stuf_bg_response("stuf_bg_family_members.xml")
 
         with requests_mock.Mocker() as m:
             m.post(
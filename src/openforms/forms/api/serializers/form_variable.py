@@ -36,7 +36,7 @@ class FormVariableListSerializer(ListWithChildSerializer):
     def validate(self, attrs):
         static_data_keys = [item.key for item in get_static_variables()]
 
-        existing_form_key_combinations = []
+        existing_form_key_combinations = set()
 
         errors = defaultdict(list)
 
@@ -62,7 +62,7 @@ class FormVariableListSerializer(ListWithChildSerializer):
                 )
                 continue
 
-            existing_form_key_combinations.append(key_form_combination)
+            existing_form_key_combinations.add(key_form_combination)
 
         if errors:
             raise ValidationError(errors)